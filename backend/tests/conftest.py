@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import functools
+import os
+import sys
+from collections.abc import AsyncIterator, Callable, Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, create_mock_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from src.core import security
+from src.core.config import get_settings
+from src.core.database import Base, get_db
+from src.core.security import generate_agent_api_key, hash_api_key
+from src.main import app
+
+import src.models  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def _isolate_settings_cache() -> Iterator[None]:
+    # get_settings is lru_cached off os.environ; drop it around every test so env patches neither
+    # leak in from the previous test nor out to the next one (this teardown runs after monkeypatch's).
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def _schema_sql() -> str:
+    # Compile the SQLite DDL for every model once; engines replay it with executescript instead of
+    # walking the metadata and compiling each CREATE statement through create_all again.
+    statements: list[str] = []
+
+    def _collect(sql, *multiparams, **params) -> None:
+        statements.append(f"{str(sql.compile(dialect=mock_engine.dialect)).strip()};")
+
+    mock_engine = create_mock_engine("sqlite+pysqlite://", _collect)
+    Base.metadata.create_all(bind=mock_engine, checkfirst=False)
+    return "\n".join(statements)
+
+
+@pytest.fixture(scope="session")
+def _schema_engine(_schema_sql: str) -> Engine:
+    # One named, shared-cache in-memory database per test session: the schema is created once and
+    # every test runs inside a transaction that is rolled back afterwards. StaticPool pins the
+    # connection that keeps the DB alive; any other connection opened on the same URI sees the same
+    # schema instead of a fresh, empty DB. Under pytest-xdist (`pytest -n auto`) each worker names
+    # its own database after PYTEST_XDIST_WORKER, so workers never share state.
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    engine = create_engine(
+        f"sqlite+pysqlite:///file:clawscore_tests_{worker}?mode=memory&cache=shared&uri=true",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite defers BEGIN until the first DML statement, so a SAVEPOINT would open (and its
+    # RELEASE would commit) the real transaction. Emit BEGIN ourselves so savepoints nest properly.
+    # The database is thrown away after the run, so durability PRAGMAs are switched off too.
+    @event.listens_for(engine, "connect")
+    def _configure_connection(dbapi_connection, connection_record) -> None:
+        dbapi_connection.isolation_level = None
+        for pragma in ("synchronous=OFF", "journal_mode=MEMORY", "temp_store=MEMORY"):
+            dbapi_connection.execute(f"PRAGMA {pragma}")
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn) -> None:
+        conn.exec_driver_sql("BEGIN")
+
+    raw = engine.raw_connection()
+    try:
+        raw.driver_connection.executescript(_schema_sql)
+    finally:
+        raw.close()
+    return engine
+
+
+@pytest.fixture()
+def _db(_schema_engine: Engine) -> Iterator[sessionmaker[Session]]:
+    # Tests and requests share one connection holding an outer transaction. Every session joins it
+    # through a SAVEPOINT, so commit() only releases the savepoint and nothing is checked out of the
+    # pool per request; rolling the outer transaction back resets the database for the next test.
+    with _schema_engine.connect() as conn:
+        outer = conn.begin()
+        try:
+            yield sessionmaker(
+                bind=conn,
+                autoflush=False,
+                autocommit=False,
+                join_transaction_mode="create_savepoint",
+            )
+        finally:
+            outer.rollback()
+
+
+@pytest.fixture(scope="session")
+def _agent_credentials() -> Callable[[str], tuple[str, str]]:
+    # (api_key, api_key_hash) per agent id, derived once per session. The hash is built with a
+    # single PBKDF2 round; verify_api_key honours the stored iteration count, so authenticated
+    # requests still go through the real check without paying 200k rounds each time.
+    @functools.cache
+    def _credentials(agent_id: str) -> tuple[str, str]:
+        api_key = generate_agent_api_key(agent_id)
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(security, "PBKDF2_ITERATIONS", 1)
+            return api_key, hash_api_key(api_key)
+
+    return _credentials
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture()
+def _get_db_override(_db: sessionmaker[Session]) -> Iterator[None]:
+    # The one place the shared clients are pointed at the test database. Only get_db is popped on
+    # teardown so overrides registered by the test itself (e.g. require_agent_auth) are left alone.
+    def _override_get_db():
+        db = _db()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = _override_get_db
+    try:
+        yield
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture(scope="session")
+def _client_session() -> TestClient:
+    return TestClient(app)
+
+
+@pytest.fixture()
+def _client(_client_session: TestClient, _get_db_override: None) -> TestClient:
+    return _client_session
+
+
+@pytest.fixture(scope="session")
+async def _async_client_session() -> AsyncIterator[httpx.AsyncClient]:
+    # Calls the ASGI app directly on the test's event loop, skipping TestClient's portal thread.
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client
+
+
+@pytest.fixture()
+def _async_client(_async_client_session: httpx.AsyncClient, _get_db_override: None) -> httpx.AsyncClient:
+    return _async_client_session
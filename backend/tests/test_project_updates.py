@@ -1,22 +1,15 @@
 from __future__ import annotations
 
-import sys
-from pathlib import Path
+import json
+from typing import Any
 
+import httpx
+import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
-
-BACKEND_DIR = Path(__file__).resolve().parents[1]
-if str(BACKEND_DIR) not in sys.path:
-    sys.path.insert(0, str(BACKEND_DIR))
 
 from src.api.v1.dependencies import require_agent_auth
-from src.core.database import Base, get_db
 from src.main import app
-
-import src.models  # noqa: F401
 from src.models.agent import Agent
 from src.models.audit_log import AuditLog
 from src.models.project import Project, ProjectStatus
@@ -30,16 +23,26 @@ from src.services.project_updates import (
 )
 
 
-def test_project_updates_create_and_list() -> None:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
+_UPDATE_PAYLOAD = {
+    "title": "Delivery completed",
+    "body_md": "Frontend and backend deliverables merged.",
+    "update_type": "delivery",
+    "source_kind": "delivery_receipt",
+    "source_ref": "receipt:prj_updates_1",
+    "ref_kind": "project_section",
+    "ref_url": "/projects/prj_updates_1#delivery-receipt",
+    "tx_hash": "0x" + ("ab" * 32),
+    "idempotency_key": "upd:test:1",
+}
+
+
+def _json(resp: httpx.Response) -> Any:
+    assert resp.status_code == 200
+    return json.loads(resp.content)
+
 
-    with session_local() as db:
+def test_project_updates_create_and_list(_client: TestClient, _db: sessionmaker[Session]) -> None:
+    with _db() as db:
         agent = Agent(
             agent_id="ag_updates_1",
             name="Updater",
@@ -48,8 +51,6 @@ def test_project_updates_create_and_list() -> None:
             api_key_hash="hash",
             api_key_last4="1234",
         )
-        db.add(agent)
-        db.flush()
         project = Project(
             project_id="prj_updates_1",
             slug="updates-one",
@@ -68,7 +69,7 @@ def test_project_updates_create_and_list() -> None:
             created_by_agent_id=None,
             approved_at=None,
         )
-        db.add(project)
+        db.add_all([agent, project])
         db.flush()
         db.add(
             ProjectMember(
@@ -77,40 +78,22 @@ def test_project_updates_create_and_list() -> None:
                 role=ProjectMemberRole.maintainer,
             )
         )
+        agent_pk = agent.id
         db.commit()
 
-    def _override_get_db():
-        db: Session = session_local()
-        try:
-            yield db
-        finally:
-            db.close()
-
     def _override_agent_auth() -> Agent:
-        with session_local() as db:
-            return db.query(Agent).filter(Agent.agent_id == "ag_updates_1").one()
+        with _db() as db:
+            return db.get(Agent, agent_pk)
 
-    app.dependency_overrides[get_db] = _override_get_db
     app.dependency_overrides[require_agent_auth] = _override_agent_auth
-    client = TestClient(app, raise_server_exceptions=False)
     try:
-        create_resp = client.post(
-            "/api/v1/agent/projects/prj_updates_1/updates",
-            json={
-                "title": "Delivery completed",
-                "body_md": "Frontend and backend deliverables merged.",
-                "update_type": "delivery",
-                "source_kind": "delivery_receipt",
-                "source_ref": "receipt:prj_updates_1",
-                "ref_kind": "project_section",
-                "ref_url": "/projects/prj_updates_1#delivery-receipt",
-                "tx_hash": "0x" + ("ab" * 32),
-                "idempotency_key": "upd:test:1",
-            },
-            headers={"X-Request-Id": "req-upd-1"},
-        )
-        assert create_resp.status_code == 200
-        create_data = create_resp.json()["data"]
+        create_data = _json(
+            _client.post(
+                "/api/v1/agent/projects/prj_updates_1/updates",
+                json=_UPDATE_PAYLOAD,
+                headers={"X-Request-Id": "req-upd-1"},
+            )
+        )["data"]
         assert create_data["project_id"] == "prj_updates_1"
         assert create_data["author_agent_id"] == "ag_updates_1"
         assert create_data["title"] == "Delivery completed"
@@ -118,27 +101,16 @@ def test_project_updates_create_and_list() -> None:
         assert create_data["ref_url"] == "/projects/prj_updates_1#delivery-receipt"
         assert create_data["tx_hash"] == "0x" + ("ab" * 32)
 
-        second_resp = client.post(
-            "/api/v1/agent/projects/prj_updates_1/updates",
-            json={
-                "title": "Delivery completed",
-                "body_md": "Frontend and backend deliverables merged.",
-                "update_type": "delivery",
-                "source_kind": "delivery_receipt",
-                "source_ref": "receipt:prj_updates_1",
-                "ref_kind": "project_section",
-                "ref_url": "/projects/prj_updates_1#delivery-receipt",
-                "tx_hash": "0x" + ("ab" * 32),
-                "idempotency_key": "upd:test:1",
-            },
-            headers={"X-Request-Id": "req-upd-2"},
-        )
-        assert second_resp.status_code == 200
-        assert second_resp.json()["data"]["update_id"] == create_data["update_id"]
+        second_data = _json(
+            _client.post(
+                "/api/v1/agent/projects/prj_updates_1/updates",
+                json=_UPDATE_PAYLOAD,
+                headers={"X-Request-Id": "req-upd-2"},
+            )
+        )["data"]
+        assert second_data["update_id"] == create_data["update_id"]
 
-        list_resp = client.get("/api/v1/projects/prj_updates_1/updates")
-        assert list_resp.status_code == 200
-        payload = list_resp.json()
+        payload = _json(_client.get("/api/v1/projects/prj_updates_1/updates"))
         assert payload["success"] is True
         assert payload["data"]["total"] == 1
         item = payload["data"]["items"][0]
@@ -149,19 +121,11 @@ def test_project_updates_create_and_list() -> None:
         assert item["ref_url"] == "/projects/prj_updates_1#delivery-receipt"
         assert item["tx_hash"] == "0x" + ("ab" * 32)
     finally:
-        app.dependency_overrides.clear()
-
+        app.dependency_overrides.pop(require_agent_auth, None)
 
-def test_project_update_dedupe_does_not_rollback_pending_audit() -> None:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
 
-    with session_local() as db:
+def test_project_update_dedupe_does_not_rollback_pending_audit(_db: sessionmaker[Session]) -> None:
+    with _db() as db:
         agent = Agent(
             agent_id="ag_updates_2",
             name="Updater Two",
@@ -191,11 +155,8 @@ def test_project_update_dedupe_does_not_rollback_pending_audit() -> None:
             approved_at=None,
         )
         db.add(project)
-        db.commit()
+        db.flush()
 
-    with session_local() as db:
-        agent = db.query(Agent).filter(Agent.agent_id == "ag_updates_2").one()
-        project = db.query(Project).filter(Project.project_id == "prj_updates_2").one()
         row, created = create_project_update_row(
             db,
             project=project,
@@ -209,9 +170,7 @@ def test_project_update_dedupe_does_not_rollback_pending_audit() -> None:
         db.commit()
         assert row.update_id
 
-    with session_local() as db:
-        agent = db.query(Agent).filter(Agent.agent_id == "ag_updates_2").one()
-        project = db.query(Project).filter(Project.project_id == "prj_updates_2").one()
+        # Same session, next "request": the audit row is pending when the duplicate insert fails.
         db.add(
             AuditLog(
                 actor_type="agent",
@@ -252,16 +211,11 @@ def test_build_project_update_idempotency_key_caps_length() -> None:
     assert "sha256:" in key
 
 
-def test_project_updates_api_derives_structured_refs_for_legacy_rows() -> None:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
-
-    with session_local() as db:
+@pytest.mark.anyio
+async def test_project_updates_api_derives_structured_refs_for_legacy_rows(
+    _async_client: httpx.AsyncClient, _db: sessionmaker[Session]
+) -> None:
+    with _db() as db:
         project = Project(
             project_id="prj_updates_legacy",
             slug="updates-legacy",
@@ -300,36 +254,14 @@ def test_project_updates_api_derives_structured_refs_for_legacy_rows() -> None:
         )
         db.commit()
 
-    def _override_get_db():
-        db: Session = session_local()
-        try:
-            yield db
-        finally:
-            db.close()
-
-    app.dependency_overrides[get_db] = _override_get_db
-    client = TestClient(app, raise_server_exceptions=False)
-    try:
-        list_resp = client.get("/api/v1/projects/prj_updates_legacy/updates")
-        assert list_resp.status_code == 200
-        item = list_resp.json()["data"]["items"][0]
-        assert item["ref_kind"] == "bounty"
-        assert item["ref_url"] == "/bounties/bty_legacy"
-        assert item["tx_hash"] == "0x" + ("cd" * 32)
-    finally:
-        app.dependency_overrides.clear()
+    item = _json(await _async_client.get("/api/v1/projects/prj_updates_legacy/updates"))["data"]["items"][0]
+    assert item["ref_kind"] == "bounty"
+    assert item["ref_url"] == "/bounties/bty_legacy"
+    assert item["tx_hash"] == "0x" + ("cd" * 32)
 
 
-def test_populate_project_update_structured_refs_backfills_legacy_row() -> None:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
-
-    with session_local() as db:
+def test_populate_project_update_structured_refs_backfills_legacy_row(_db: sessionmaker[Session]) -> None:
+    with _db() as db:
         project = Project(
             project_id="prj_updates_fill",
             slug="updates-fill",
@@ -365,8 +297,7 @@ def test_populate_project_update_structured_refs_backfills_legacy_row() -> None:
             tx_hash=None,
         )
         db.add(row)
-        db.commit()
-        db.refresh(row)
+        db.flush()
 
         changed = populate_project_update_structured_refs(
             project_public_id=project.project_id,
@@ -379,16 +310,8 @@ def test_populate_project_update_structured_refs_backfills_legacy_row() -> None:
         assert row.tx_hash == "0x" + ("ef" * 32)
 
 
-def test_project_update_public_preserves_stored_ref_kind_when_only_ref_url_is_derived() -> None:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
-
-    with session_local() as db:
+def test_project_update_public_preserves_stored_ref_kind_when_only_ref_url_is_derived(_db: sessionmaker[Session]) -> None:
+    with _db() as db:
         project = Project(
             project_id="prj_updates_preserve",
             slug="updates-preserve",
@@ -431,16 +354,11 @@ def test_project_update_public_preserves_stored_ref_kind_when_only_ref_url_is_de
         assert public["ref_url"] == "/discussions/threads/thr_preserve"
 
 
-def test_project_updates_support_server_side_commercial_and_operational_slices() -> None:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
-
-    with session_local() as db:
+@pytest.mark.anyio
+async def test_project_updates_support_server_side_commercial_and_operational_slices(
+    _async_client: httpx.AsyncClient, _db: sessionmaker[Session]
+) -> None:
+    with _db() as db:
         project = Project(
             project_id="prj_updates_slice",
             slug="updates-slice",
@@ -495,41 +413,20 @@ def test_project_updates_support_server_side_commercial_and_operational_slices()
         )
         db.commit()
 
-    def _override_get_db():
-        db: Session = session_local()
-        try:
-            yield db
-        finally:
-            db.close()
-
-    app.dependency_overrides[get_db] = _override_get_db
-    client = TestClient(app, raise_server_exceptions=False)
-    try:
-        commercial_resp = client.get("/api/v1/projects/prj_updates_slice/updates?slice=commercial")
-        assert commercial_resp.status_code == 200
-        commercial_items = commercial_resp.json()["data"]["items"]
-        assert len(commercial_items) == 1
-        assert commercial_items[0]["source_kind"] == "billing_settlement"
-
-        operational_resp = client.get("/api/v1/projects/prj_updates_slice/updates?slice=operational")
-        assert operational_resp.status_code == 200
-        operational_items = operational_resp.json()["data"]["items"]
-        assert len(operational_items) == 1
-        assert operational_items[0]["source_kind"] == "funding_round"
-    finally:
-        app.dependency_overrides.clear()
+    commercial_items = _json(await _async_client.get("/api/v1/projects/prj_updates_slice/updates?slice=commercial"))["data"]["items"]
+    assert len(commercial_items) == 1
+    assert commercial_items[0]["source_kind"] == "billing_settlement"
 
+    operational_items = _json(await _async_client.get("/api/v1/projects/prj_updates_slice/updates?slice=operational"))["data"]["items"]
+    assert len(operational_items) == 1
+    assert operational_items[0]["source_kind"] == "funding_round"
 
-def test_project_updates_slice_alias_endpoints_match_slice_query() -> None:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
 
-    with session_local() as db:
+@pytest.mark.anyio
+async def test_project_updates_slice_alias_endpoints_match_slice_query(
+    _async_client: httpx.AsyncClient, _db: sessionmaker[Session]
+) -> None:
+    with _db() as db:
         project = Project(
             project_id="prj_updates_slice_alias",
             slug="updates-slice-alias",
@@ -584,41 +481,20 @@ def test_project_updates_slice_alias_endpoints_match_slice_query() -> None:
         )
         db.commit()
 
-    def _override_get_db():
-        db: Session = session_local()
-        try:
-            yield db
-        finally:
-            db.close()
-
-    app.dependency_overrides[get_db] = _override_get_db
-    client = TestClient(app, raise_server_exceptions=False)
-    try:
-        commercial_query = client.get("/api/v1/projects/prj_updates_slice_alias/updates?slice=commercial")
-        commercial_alias = client.get("/api/v1/projects/prj_updates_slice_alias/updates/commercial")
-        assert commercial_query.status_code == 200
-        assert commercial_alias.status_code == 200
-        assert commercial_alias.json()["data"]["items"] == commercial_query.json()["data"]["items"]
-
-        operational_query = client.get("/api/v1/projects/prj_updates_slice_alias/updates?slice=operational")
-        operational_alias = client.get("/api/v1/projects/prj_updates_slice_alias/updates/operational")
-        assert operational_query.status_code == 200
-        assert operational_alias.status_code == 200
-        assert operational_alias.json()["data"]["items"] == operational_query.json()["data"]["items"]
-    finally:
-        app.dependency_overrides.clear()
+    commercial_query = _json(await _async_client.get("/api/v1/projects/prj_updates_slice_alias/updates?slice=commercial"))
+    commercial_alias = _json(await _async_client.get("/api/v1/projects/prj_updates_slice_alias/updates/commercial"))
+    assert commercial_alias["data"]["items"] == commercial_query["data"]["items"]
 
+    operational_query = _json(await _async_client.get("/api/v1/projects/prj_updates_slice_alias/updates?slice=operational"))
+    operational_alias = _json(await _async_client.get("/api/v1/projects/prj_updates_slice_alias/updates/operational"))
+    assert operational_alias["data"]["items"] == operational_query["data"]["items"]
 
-def test_project_updates_latest_endpoint_returns_newest_item_or_null() -> None:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
 
-    with session_local() as db:
+@pytest.mark.anyio
+async def test_project_updates_latest_endpoint_returns_newest_item_or_null(
+    _async_client: httpx.AsyncClient, _db: sessionmaker[Session]
+) -> None:
+    with _db() as db:
         project = Project(
             project_id="prj_updates_latest",
             slug="updates-latest",
@@ -638,77 +514,57 @@ def test_project_updates_latest_endpoint_returns_newest_item_or_null() -> None:
             approved_at=None,
         )
         db.add(project)
+        db.flush()
+        project_pk = project.id
         db.commit()
 
-    def _override_get_db():
-        db: Session = session_local()
-        try:
-            yield db
-        finally:
-            db.close()
+    assert _json(await _async_client.get("/api/v1/projects/prj_updates_latest/updates/latest"))["data"] is None
 
-    app.dependency_overrides[get_db] = _override_get_db
-    client = TestClient(app, raise_server_exceptions=False)
-    try:
-        empty_resp = client.get("/api/v1/projects/prj_updates_latest/updates/latest")
-        assert empty_resp.status_code == 200
-        assert empty_resp.json()["data"] is None
-
-        with session_local() as db:
-            project = db.query(Project).filter(Project.project_id == "prj_updates_latest").one()
-            db.add(
-                ProjectUpdate(
-                    update_id="pup_latest_1",
-                    idempotency_key="upd:test:latest:1",
-                    project_id=project.id,
-                    author_agent_id=None,
-                    update_type="ops",
-                    title="Older",
-                    body_md=None,
-                    source_kind="funding_round",
-                    source_ref="fr_1",
-                    ref_kind=None,
-                    ref_url=None,
-                    tx_hash=None,
-                )
+    with _db() as db:
+        db.add(
+            ProjectUpdate(
+                update_id="pup_latest_1",
+                idempotency_key="upd:test:latest:1",
+                project_id=project_pk,
+                author_agent_id=None,
+                update_type="ops",
+                title="Older",
+                body_md=None,
+                source_kind="funding_round",
+                source_ref="fr_1",
+                ref_kind=None,
+                ref_url=None,
+                tx_hash=None,
             )
-            db.add(
-                ProjectUpdate(
-                    update_id="pup_latest_2",
-                    idempotency_key="upd:test:latest:2",
-                    project_id=project.id,
-                    author_agent_id=None,
-                    update_type="revenue",
-                    title="Newest",
-                    body_md=None,
-                    source_kind="billing_settlement",
-                    source_ref="inv_2",
-                    ref_kind=None,
-                    ref_url=None,
-                    tx_hash=None,
-                )
+        )
+        db.add(
+            ProjectUpdate(
+                update_id="pup_latest_2",
+                idempotency_key="upd:test:latest:2",
+                project_id=project_pk,
+                author_agent_id=None,
+                update_type="revenue",
+                title="Newest",
+                body_md=None,
+                source_kind="billing_settlement",
+                source_ref="inv_2",
+                ref_kind=None,
+                ref_url=None,
+                tx_hash=None,
             )
-            db.commit()
-
-        latest_resp = client.get("/api/v1/projects/prj_updates_latest/updates/latest")
-        assert latest_resp.status_code == 200
-        payload = latest_resp.json()
-        assert payload["data"]["title"] == "Newest"
-        assert payload["data"]["source_kind"] == "billing_settlement"
-    finally:
-        app.dependency_overrides.clear()
+        )
+        db.commit()
 
+    payload = _json(await _async_client.get("/api/v1/projects/prj_updates_latest/updates/latest"))
+    assert payload["data"]["title"] == "Newest"
+    assert payload["data"]["source_kind"] == "billing_settlement"
 
-def test_project_updates_summary_returns_counts_and_latest_by_slice() -> None:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
 
-    with session_local() as db:
+@pytest.mark.anyio
+async def test_project_updates_summary_returns_counts_and_latest_by_slice(
+    _async_client: httpx.AsyncClient, _db: sessionmaker[Session]
+) -> None:
+    with _db() as db:
         project = Project(
             project_id="prj_updates_summary",
             slug="updates-summary",
@@ -763,50 +619,32 @@ def test_project_updates_summary_returns_counts_and_latest_by_slice() -> None:
         )
         db.commit()
 
-    def _override_get_db():
-        db: Session = session_local()
-        try:
-            yield db
-        finally:
-            db.close()
-
-    app.dependency_overrides[get_db] = _override_get_db
-    client = TestClient(app, raise_server_exceptions=False)
-    try:
-        resp = client.get("/api/v1/projects/prj_updates_summary/updates/summary")
-        assert resp.status_code == 200
-        assert resp.headers["Cache-Control"] == "public, max-age=30"
-        assert "project-updates-summary:prj_updates_summary:2:1:1:" in resp.headers["ETag"]
-        data = resp.json()["data"]
-        assert data["project_id"] == "prj_updates_summary"
-        assert data["total_count"] == 2
-        assert data["commercial_count"] == 1
-        assert data["operational_count"] == 1
-        assert data["latest"]["title"] == "Commercial summary item"
-        assert data["latest_commercial"]["title"] == "Commercial summary item"
-        assert data["latest_operational"]["title"] == "Operational summary item"
-
-        cached_resp = client.get(
-            "/api/v1/projects/prj_updates_summary/updates/summary",
-            headers={"If-None-Match": resp.headers["ETag"]},
-        )
-        assert cached_resp.status_code == 304
-        assert cached_resp.headers["Cache-Control"] == "public, max-age=30"
-        assert cached_resp.headers["ETag"] == resp.headers["ETag"]
-    finally:
-        app.dependency_overrides.clear()
-
-
-def test_project_updates_source_kinds_summary_groups_counts_and_latest() -> None:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+    resp = await _async_client.get("/api/v1/projects/prj_updates_summary/updates/summary")
+    data = _json(resp)["data"]
+    assert resp.headers["Cache-Control"] == "public, max-age=30"
+    assert "project-updates-summary:prj_updates_summary:2:1:1:" in resp.headers["ETag"]
+    assert data["project_id"] == "prj_updates_summary"
+    assert data["total_count"] == 2
+    assert data["commercial_count"] == 1
+    assert data["operational_count"] == 1
+    assert data["latest"]["title"] == "Commercial summary item"
+    assert data["latest_commercial"]["title"] == "Commercial summary item"
+    assert data["latest_operational"]["title"] == "Operational summary item"
+
+    cached_resp = await _async_client.get(
+        "/api/v1/projects/prj_updates_summary/updates/summary",
+        headers={"If-None-Match": resp.headers["ETag"]},
     )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
+    assert cached_resp.status_code == 304
+    assert cached_resp.headers["Cache-Control"] == "public, max-age=30"
+    assert cached_resp.headers["ETag"] == resp.headers["ETag"]
 
-    with session_local() as db:
+
+@pytest.mark.anyio
+async def test_project_updates_source_kinds_summary_groups_counts_and_latest(
+    _async_client: httpx.AsyncClient, _db: sessionmaker[Session]
+) -> None:
+    with _db() as db:
         agent = Agent(
             agent_id="ag_updates_kind_1",
             name="Kinds Bot",
@@ -885,29 +723,15 @@ def test_project_updates_source_kinds_summary_groups_counts_and_latest() -> None
         )
         db.commit()
 
-    def _override_get_db():
-        db: Session = session_local()
-        try:
-            yield db
-        finally:
-            db.close()
-
-    app.dependency_overrides[get_db] = _override_get_db
-    client = TestClient(app, raise_server_exceptions=False)
-    try:
-        resp = client.get("/api/v1/projects/prj_updates_kinds/updates/source-kinds")
-        assert resp.status_code == 200
-        payload = resp.json()
-        assert payload["success"] is True
-        assert payload["data"]["project_id"] == "prj_updates_kinds"
-        assert payload["data"]["total_count"] == 3
-        buckets = payload["data"]["buckets"]
-        assert len(buckets) == 2
-        assert buckets[0]["source_kind"] == "crypto_invoice"
-        assert buckets[0]["count"] == 2
-        assert buckets[0]["latest"]["title"] == "Invoice settled"
-        assert buckets[1]["source_kind"] is None
-        assert buckets[1]["count"] == 1
-        assert buckets[1]["latest"]["title"] == "Manual ops note"
-    finally:
-        app.dependency_overrides.clear()
+    payload = _json(await _async_client.get("/api/v1/projects/prj_updates_kinds/updates/source-kinds"))
+    assert payload["success"] is True
+    assert payload["data"]["project_id"] == "prj_updates_kinds"
+    assert payload["data"]["total_count"] == 3
+    buckets = payload["data"]["buckets"]
+    assert len(buckets) == 2
+    assert buckets[0]["source_kind"] == "crypto_invoice"
+    assert buckets[0]["count"] == 2
+    assert buckets[0]["latest"]["title"] == "Invoice settled"
+    assert buckets[1]["source_kind"] is None
+    assert buckets[1]["count"] == 1
+    assert buckets[1]["latest"]["title"] == "Manual ops note"
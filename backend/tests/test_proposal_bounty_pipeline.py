@@ -1,57 +1,15 @@
 from __future__ import annotations
 
-import sys
 from datetime import datetime, timezone
-from pathlib import Path
 
-import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
-BACKEND_DIR = Path(__file__).resolve().parents[1]
-if str(BACKEND_DIR) not in sys.path:
-    sys.path.insert(0, str(BACKEND_DIR))
-
-from src.core.database import Base, get_db
-from src.main import app
-
-import src.models  # noqa: F401
 from src.models.agent import Agent
 from src.models.bounty import Bounty, BountyFundingSource, BountyStatus
 from src.models.proposal import Proposal, ProposalStatus
 
 
-@pytest.fixture()
-def _db() -> sessionmaker[Session]:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
-    return session_local
-
-
-@pytest.fixture()
-def _client(_db: sessionmaker[Session]) -> TestClient:
-    def _override_get_db():
-        db = _db()
-        try:
-            yield db
-        finally:
-            db.close()
-
-    app.dependency_overrides[get_db] = _override_get_db
-    client = TestClient(app, raise_server_exceptions=False)
-    try:
-        yield client
-    finally:
-        app.dependency_overrides.clear()
-
-
 def test_proposal_detail_includes_related_bounties_and_list_filter_works(
     _client: TestClient, _db: sessionmaker[Session]
 ) -> None:
@@ -65,8 +23,7 @@ def test_proposal_detail_includes_related_bounties_and_list_filter_works(
             capabilities_json="{}",
         )
         db.add(agent)
-        db.commit()
-        db.refresh(agent)
+        db.flush()
 
         proposal = Proposal(
             proposal_id="prp_1",
@@ -85,9 +42,6 @@ def test_proposal_detail_includes_related_bounties_and_list_filter_works(
             yes_votes_count=0,
             no_votes_count=0,
         )
-        db.add(proposal)
-        db.commit()
-
         bounty = Bounty(
             bounty_id="bty_1",
             idempotency_key=None,
@@ -107,7 +61,7 @@ def test_proposal_detail_includes_related_bounties_and_list_filter_works(
             merge_sha=None,
             paid_tx_hash=None,
         )
-        db.add(bounty)
+        db.add_all([proposal, bounty])
         db.commit()
 
     r = _client.get("/api/v1/proposals/prp_1")
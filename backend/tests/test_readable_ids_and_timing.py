@@ -1,79 +1,33 @@
 from __future__ import annotations
 
-import sys
+from collections.abc import Callable
 from datetime import datetime
-from pathlib import Path
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
-BACKEND_DIR = Path(__file__).resolve().parents[1]
-if str(BACKEND_DIR) not in sys.path:
-    sys.path.insert(0, str(BACKEND_DIR))
-
-from src.core.config import get_settings
-from src.core.database import Base, get_db
-from src.core.security import generate_agent_api_key, hash_api_key
-from src.main import app
-
-import src.models  # noqa: F401
 from src.models.agent import Agent
 from src.models.project import Project, ProjectStatus
 
 
 @pytest.fixture(autouse=True)
-def _isolate_settings_cache() -> None:
-    get_settings.cache_clear()
-    yield
-    get_settings.cache_clear()
-
-
-@pytest.fixture()
-def _db() -> sessionmaker[Session]:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
-    return session_local
-
-
-@pytest.fixture()
-def _client(_db: sessionmaker[Session], monkeypatch: pytest.MonkeyPatch) -> TestClient:
+def _relax_discussion_rate_limits(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("DISCUSSIONS_CREATE_POST_MAX_PER_MINUTE", "1000")
     monkeypatch.setenv("DISCUSSIONS_CREATE_POST_MAX_PER_DAY", "1000")
     monkeypatch.setenv("DISCUSSIONS_CREATE_THREAD_MAX_PER_MINUTE", "1000")
     monkeypatch.setenv("DISCUSSIONS_CREATE_THREAD_MAX_PER_DAY", "1000")
 
-    def _override_get_db():
-        db = _db()
-        try:
-            yield db
-        finally:
-            db.close()
-
-    app.dependency_overrides[get_db] = _override_get_db
-    client = TestClient(app, raise_server_exceptions=False)
-    try:
-        yield client
-    finally:
-        app.dependency_overrides.clear()
-
 
-def _seed_agent(db: Session, *, agent_id: str = "ag_readable") -> str:
-    api_key = generate_agent_api_key(agent_id)
+def _seed_agent(db: Session, credentials: tuple[str, str]) -> str:
+    api_key, api_key_hash = credentials
     db.add(
         Agent(
-            agent_id=agent_id,
+            agent_id="ag_readable",
             name="Readable Agent",
             capabilities_json="[]",
             wallet_address=None,
-            api_key_hash=hash_api_key(api_key),
+            api_key_hash=api_key_hash,
             api_key_last4=api_key[-4:],
         )
     )
@@ -93,12 +47,17 @@ def _dt(value: str) -> datetime:
     return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 
-def test_numeric_display_ids_custom_timing_and_subthreads(_client: TestClient, _db: sessionmaker[Session]) -> None:
+@pytest.mark.anyio
+async def test_numeric_display_ids_custom_timing_and_subthreads(
+    _async_client: httpx.AsyncClient,
+    _db: sessionmaker[Session],
+    _agent_credentials: Callable[[str], tuple[str, str]],
+) -> None:
     with _db() as db:
-        api_key = _seed_agent(db)
+        api_key = _seed_agent(db, _agent_credentials("ag_readable"))
 
     # Agent register returns numeric id.
-    reg = _client.post(
+    reg = await _async_client.post(
         "/api/v1/agents/register",
         json={"name": "Second Agent", "capabilities": []},
     )
@@ -107,7 +66,7 @@ def test_numeric_display_ids_custom_timing_and_subthreads(_client: TestClient, _
     assert isinstance(reg_body.get("agent_num"), int)
 
     # Proposal create -> submit with custom timing windows.
-    created = _client.post(
+    created = await _async_client.post(
         "/api/v1/agent/proposals",
         headers={"X-API-Key": api_key, "Idempotency-Key": "readable:proposal:create"},
         json={"title": "Readable Governance", "description_md": "Make data human-friendly."},
@@ -117,7 +76,7 @@ def test_numeric_display_ids_custom_timing_and_subthreads(_client: TestClient, _
     proposal_id = proposal["proposal_id"]
     proposal_num = int(proposal["proposal_num"])
 
-    submitted = _client.post(
+    submitted = await _async_client.post(
         f"/api/v1/agent/proposals/{proposal_num}/submit",
         headers={"X-API-Key": api_key, "Idempotency-Key": "readable:proposal:submit"},
         json={"discussion_minutes": 5, "voting_minutes": 7},
@@ -135,14 +94,14 @@ def test_numeric_display_ids_custom_timing_and_subthreads(_client: TestClient, _
     assert 418 <= int((voting_ends - voting_starts).total_seconds()) <= 450
 
     # discussion_minutes=0 should jump directly into voting on submit.
-    instant = _client.post(
+    instant = await _async_client.post(
         "/api/v1/agent/proposals",
         headers={"X-API-Key": api_key, "Idempotency-Key": "readable:proposal:create:instant"},
         json={"title": "Instant Voting Proposal", "description_md": "Skip discussion for test."},
     )
     assert instant.status_code == 200
     instant_num = int(instant.json()["data"]["proposal_num"])
-    instant_submit = _client.post(
+    instant_submit = await _async_client.post(
         f"/api/v1/agent/proposals/{instant_num}/submit",
         headers={"X-API-Key": api_key, "Idempotency-Key": "readable:proposal:submit:instant"},
         json={"discussion_minutes": 0, "voting_minutes": 3},
@@ -154,12 +113,12 @@ def test_numeric_display_ids_custom_timing_and_subthreads(_client: TestClient, _
     assert 178 <= int((_dt(instant_data["voting_ends_at"]) - _dt(instant_data["voting_starts_at"])).total_seconds()) <= 210
 
     # Numeric lookup works for proposal detail endpoint.
-    proposal_by_num = _client.get(f"/api/v1/proposals/{proposal_num}")
+    proposal_by_num = await _async_client.get(f"/api/v1/proposals/{proposal_num}")
     assert proposal_by_num.status_code == 200
     assert proposal_by_num.json()["data"]["proposal_id"] == proposal_id
 
     # Global parent thread + sub-thread flow.
-    parent = _client.post(
+    parent = await _async_client.post(
         "/api/v1/agent/discussions/threads",
         headers={"X-API-Key": api_key},
         json={"scope": "global", "title": "Platform Research Topics"},
@@ -167,7 +126,7 @@ def test_numeric_display_ids_custom_timing_and_subthreads(_client: TestClient, _
     assert parent.status_code == 200
     parent_data = parent.json()["data"]
 
-    child = _client.post(
+    child = await _async_client.post(
         "/api/v1/agent/discussions/threads",
         headers={"X-API-Key": api_key},
         json={
@@ -180,7 +139,7 @@ def test_numeric_display_ids_custom_timing_and_subthreads(_client: TestClient, _
     child_data = child.json()["data"]
     assert child_data["parent_thread_id"] == parent_data["thread_id"]
 
-    listed = _client.get(
+    listed = await _async_client.get(
         f"/api/v1/discussions/threads?scope=global&parent_thread_id={parent_data['thread_num']}"
     )
     assert listed.status_code == 200
@@ -189,11 +148,11 @@ def test_numeric_display_ids_custom_timing_and_subthreads(_client: TestClient, _
     assert listed_items[0]["thread_id"] == child_data["thread_id"]
 
     # Thread and post numeric lookups.
-    thread_by_num = _client.get(f"/api/v1/discussions/threads/{child_data['thread_num']}")
+    thread_by_num = await _async_client.get(f"/api/v1/discussions/threads/{child_data['thread_num']}")
     assert thread_by_num.status_code == 200
     assert thread_by_num.json()["data"]["thread_id"] == child_data["thread_id"]
 
-    post = _client.post(
+    post = await _async_client.post(
         f"/api/v1/agent/discussions/threads/{child_data['thread_num']}/posts",
         headers={"X-API-Key": api_key},
         json={"body_md": "We should validate pricing hypotheses with 3 cohorts."},
@@ -202,12 +161,12 @@ def test_numeric_display_ids_custom_timing_and_subthreads(_client: TestClient, _
     post_data = post.json()["data"]
     assert post_data["author_agent_name"] == "Readable Agent"
 
-    post_by_num = _client.get(f"/api/v1/discussions/posts/{post_data['post_num']}")
+    post_by_num = await _async_client.get(f"/api/v1/discussions/posts/{post_data['post_num']}")
     assert post_by_num.status_code == 200
     assert post_by_num.json()["data"]["post_id"] == post_data["post_id"]
 
     # Bounty numeric route compatibility.
-    bounty = _client.post(
+    bounty = await _async_client.post(
         "/api/v1/agent/bounties",
         headers={"X-API-Key": api_key},
         json={
@@ -221,7 +180,7 @@ def test_numeric_display_ids_custom_timing_and_subthreads(_client: TestClient, _
     assert bounty.status_code == 200
     bounty_data = bounty.json()["data"]
 
-    claim = _client.post(
+    claim = await _async_client.post(
         f"/api/v1/bounties/{bounty_data['bounty_num']}/claim",
         headers={"X-API-Key": api_key},
         json={},
@@ -1,60 +1,16 @@
 from __future__ import annotations
 
 import json
-import sys
-from pathlib import Path
 
-import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
-BACKEND_DIR = Path(__file__).resolve().parents[1]
-if str(BACKEND_DIR) not in sys.path:
-    sys.path.insert(0, str(BACKEND_DIR))
-
-from src.core.database import Base, get_db
-from src.main import app
-
-import src.models  # noqa: F401
 from src.models.agent import Agent
 from src.models.observed_social_signal import ObservedSocialSignal
 from src.models.observed_social_signal_decision import ObservedSocialSignalDecision
 from src.models.reputation_event import ReputationEvent
 
 
-@pytest.fixture()
-def _db() -> sessionmaker[Session]:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
-    return session_local
-
-
-@pytest.fixture()
-def _client(_db: sessionmaker[Session]) -> TestClient:
-    def _override_get_db():
-        db = _db()
-        try:
-            yield db
-        finally:
-            db.close()
-
-    app.dependency_overrides[get_db] = _override_get_db
-    # Don't swallow server exceptions: if a route returns 500, we want the
-    # traceback in CI logs to diagnose the underlying bug.
-    client = TestClient(app, raise_server_exceptions=True)
-    try:
-        yield client
-    finally:
-        app.dependency_overrides.clear()
-
-
 def test_register_agent_creates_bootstrap_reputation_event_and_public_reads_use_events(
     _client: TestClient, _db: sessionmaker[Session]
 ) -> None:
@@ -82,23 +38,25 @@ def test_register_agent_creates_bootstrap_reputation_event_and_public_reads_use_
     # Reputation summary uses reputation_events
     r_sum = _client.get(f"/api/v1/reputation/agents/{agent_id}")
     assert r_sum.status_code == 200
-    assert r_sum.json()["data"]["total_points"] == 100
-    assert r_sum.json()["data"]["general_points"] == 100
-    assert r_sum.json()["data"]["governance_points"] == 0
-    assert r_sum.json()["data"]["delivery_points"] == 0
-    assert r_sum.json()["data"]["investor_points"] == 0
-    assert isinstance(r_sum.json()["data"]["agent_num"], int)
-    assert r_sum.json()["data"]["agent_name"] == "Alice"
-
-    r_sum_numeric = _client.get(f"/api/v1/reputation/agents/{r_sum.json()['data']['agent_num']}")
+    summary = r_sum.json()["data"]
+    assert summary["total_points"] == 100
+    assert summary["general_points"] == 100
+    assert summary["governance_points"] == 0
+    assert summary["delivery_points"] == 0
+    assert summary["investor_points"] == 0
+    assert isinstance(summary["agent_num"], int)
+    assert summary["agent_name"] == "Alice"
+
+    r_sum_numeric = _client.get(f"/api/v1/reputation/agents/{summary['agent_num']}")
     assert r_sum_numeric.status_code == 200
     assert r_sum_numeric.json()["data"]["agent_id"] == agent_id
 
     r_lb = _client.get("/api/v1/reputation/leaderboard")
     assert r_lb.status_code == 200
-    assert r_lb.json()["data"]["items"][0]["agent_name"] == "Alice"
-    assert r_lb.json()["data"]["items"][0]["general_points"] == 100
-    assert isinstance(r_lb.json()["data"]["items"][0]["agent_num"], int)
+    top = r_lb.json()["data"]["items"][0]
+    assert top["agent_name"] == "Alice"
+    assert top["general_points"] == 100
+    assert isinstance(top["agent_num"], int)
 
     r_policy = _client.get("/api/v1/reputation/policy")
     assert r_policy.status_code == 200
@@ -273,16 +231,8 @@ def test_reputation_leaderboard_supports_commercial_and_safety_sort(
     assert r_safety.json()["data"]["items"][0]["agent_id"] == "ag_safe"
 
 
-def test_social_verifier_decisions_public_read() -> None:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
-
-    with session_local() as db:
+def test_social_verifier_decisions_public_read(_client: TestClient, _db: sessionmaker[Session]) -> None:
+    with _db() as db:
         agent = Agent(
             agent_id="ag_diag",
             name="Diag Agent",
@@ -331,22 +281,10 @@ def test_social_verifier_decisions_public_read() -> None:
         )
         db.commit()
 
-    def _override_get_db():
-        db = session_local()
-        try:
-            yield db
-        finally:
-            db.close()
-
-    app.dependency_overrides[get_db] = _override_get_db
-    client = TestClient(app, raise_server_exceptions=True)
-    try:
-        resp = client.get("/api/v1/reputation/verifier/social-decisions?limit=10&offset=0")
-        assert resp.status_code == 200
-        item = resp.json()["data"]["items"][0]
-        assert item["decision_status"] == "promoted"
-        assert item["platform"] == "telegram"
-        assert item["account_handle"] == "clawstelegram"
-        assert item["reputation_event_id"] == "rep_diag_1"
-    finally:
-        app.dependency_overrides.clear()
+    resp = _client.get("/api/v1/reputation/verifier/social-decisions?limit=10&offset=0")
+    assert resp.status_code == 200
+    item = resp.json()["data"]["items"][0]
+    assert item["decision_status"] == "promoted"
+    assert item["platform"] == "telegram"
+    assert item["account_handle"] == "clawstelegram"
+    assert item["reputation_event_id"] == "rep_diag_1"
@@ -3,225 +3,205 @@ from __future__ import annotations
 import hashlib
 import hmac
 import json
-import sys
 import time
-from datetime import datetime, timedelta, timezone
-from pathlib import Path
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import Any
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
-BACKEND_DIR = Path(__file__).resolve().parents[1]
-if str(BACKEND_DIR) not in sys.path:
-    sys.path.insert(0, str(BACKEND_DIR))
-
-from src.core.config import get_settings
-from src.core.database import Base, get_db
 from src.core.security import build_oracle_hmac_v2_payload
-from src.main import app
-
-import src.models  # noqa: F401
 from src.models.tx_outbox import TxOutbox
 
 ORACLE_SECRET = "test-oracle-secret"
+_SECRET_BYTES = ORACLE_SECRET.encode("utf-8")
+_EMPTY_BODY_HASH = hashlib.sha256(b"").hexdigest()
+_ENQUEUE_PATH = "/api/v1/oracle/tx-outbox"
+_CLAIM_NEXT_PATH = "/api/v1/oracle/tx-outbox/claim-next"
+# Any lock taken this long before the tests run is past the 1s TTL the stale-lock test configures.
+_STALE_LOCKED_AT = datetime.fromtimestamp(time.time() - 10, tz=timezone.utc)
+
+
+def _sign(keyed: hmac.HMAC, payload: str) -> str:
+    # copy() clones the already-keyed inner/outer digests, so the ipad/opad setup is paid once per key.
+    mac = keyed.copy()
+    mac.update(payload.encode("utf-8"))
+    return mac.hexdigest()
+
+
+def _canon(obj: object) -> bytes:
+    # Same canonical encoding the oracle workers sign: sorted keys, no whitespace.
+    return json.dumps(obj, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+class _Oracle:
+    """Signs oracle requests with the v2 HMAC scheme and sends them through the test client."""
+
+    __slots__ = ("client", "keyed")
+
+    def __init__(self, client: TestClient, secret: bytes) -> None:
+        self.client = client
+        self.keyed = hmac.new(secret, digestmod=hashlib.sha256)
+
+    def headers(
+        self, path: str, body: bytes, request_id: str, *, idem: str, method: str = "POST", ts: str | None = None
+    ) -> dict[str, str]:
+        timestamp = ts if ts is not None else str(time.time_ns() // 1_000_000_000)
+        body_hash = hashlib.sha256(body).hexdigest() if body else _EMPTY_BODY_HASH
+        payload = build_oracle_hmac_v2_payload(timestamp, request_id, method, path, body_hash)
+        return {
+            "Content-Type": "application/json",
+            "X-Request-Timestamp": timestamp,
+            "X-Request-Id": request_id,
+            "Idempotency-Key": idem,
+            "X-Signature": _sign(self.keyed, payload),
+        }
+
+    def signed(
+        self, path: str, obj: object, request_id: str, *, idem: str, ts: str | None = None
+    ) -> tuple[bytes, dict[str, str]]:
+        body = _canon(obj)
+        return body, self.headers(path, body, request_id, idem=idem, ts=ts)
+
+    def post(self, path: str, obj: object, request_id: str, *, idem: str, ts: str | None = None) -> dict[str, Any]:
+        body, headers = self.signed(path, obj, request_id, idem=idem, ts=ts)
+        resp = self.client.post(path, content=body, headers=headers)
+        assert resp.status_code == 200
+        return json.loads(resp.content)
 
-
-def _sign(secret: str, payload: str) -> str:
-    return hmac.new(secret.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256).hexdigest()
-
-
-def _oracle_headers(
-    path: str, body: bytes, request_id: str, *, idem: str, method: str = "POST"
-) -> dict[str, str]:
-    timestamp = str(int(time.time()))
-    body_hash = hashlib.sha256(body).hexdigest()
-    payload = build_oracle_hmac_v2_payload(timestamp, request_id, method, path, body_hash)
-    return {
-        "Content-Type": "application/json",
-        "X-Request-Timestamp": timestamp,
-        "X-Request-Id": request_id,
-        "Idempotency-Key": idem,
-        "X-Signature": _sign(ORACLE_SECRET, payload),
-    }
-
-
-@pytest.fixture(autouse=True)
-def _isolate_settings_cache() -> None:
-    get_settings.cache_clear()
-    yield
-    get_settings.cache_clear()
+    def get(self, path: str, request_id: str, *, idem: str, query: str = "") -> dict[str, Any]:
+        # The signature covers the path only; the query string is appended afterwards.
+        headers = self.headers(path, b"", request_id, idem=idem, method="GET")
+        resp = self.client.get(f"{path}?{query}" if query else path, headers=headers)
+        assert resp.status_code == 200
+        return json.loads(resp.content)
 
 
-@pytest.fixture()
-def _db() -> sessionmaker[Session]:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False)
-    Base.metadata.create_all(bind=engine)
-    return session_local
+@pytest.fixture(scope="module", autouse=True)
+def _oracle_env() -> Iterator[None]:
+    # The oracle settings are the same for every test here, so they are patched once per module;
+    # the cached settings are still rebuilt per test by the conftest _isolate_settings_cache.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ORACLE_HMAC_SECRET", ORACLE_SECRET)
+        mp.setenv("ORACLE_REQUEST_TTL_SECONDS", "300")
+        mp.setenv("ORACLE_CLOCK_SKEW_SECONDS", "5")
+        mp.setenv("ORACLE_ACCEPT_LEGACY_SIGNATURES", "false")
+        yield
 
 
 @pytest.fixture()
-def _client(_db: sessionmaker[Session], monkeypatch: pytest.MonkeyPatch) -> TestClient:
-    monkeypatch.setenv("ORACLE_HMAC_SECRET", ORACLE_SECRET)
-    monkeypatch.setenv("ORACLE_REQUEST_TTL_SECONDS", "300")
-    monkeypatch.setenv("ORACLE_CLOCK_SKEW_SECONDS", "5")
-    monkeypatch.setenv("ORACLE_ACCEPT_LEGACY_SIGNATURES", "false")
-
-    def _override_get_db():
-        db = _db()
-        try:
-            yield db
-        finally:
-            db.close()
-
-    app.dependency_overrides[get_db] = _override_get_db
-    client = TestClient(app, raise_server_exceptions=False)
-    try:
-        yield client
-    finally:
-        app.dependency_overrides.clear()
-
-
-def test_tx_outbox_enqueue_claim_complete_happy_path(_client: TestClient) -> None:
-    enqueue_path = "/api/v1/oracle/tx-outbox"
-    enqueue_body = json.dumps(
-        {"task_type": "noop", "payload": {"x": 1}, "idempotency_key": "idem-1"},
-        separators=(",", ":"),
-        sort_keys=True,
-    ).encode("utf-8")
-    resp = _client.post(
-        enqueue_path,
-        content=enqueue_body,
-        headers=_oracle_headers(enqueue_path, enqueue_body, "req-enq", idem="idem-enq"),
+def _oracle(_client: TestClient) -> _Oracle:
+    return _Oracle(_client, _SECRET_BYTES)
+
+
+def _enqueue(oracle: _Oracle, key: str, *, task_type: str = "noop", ts: str | None = None) -> str:
+    data = oracle.post(
+        _ENQUEUE_PATH,
+        {"task_type": task_type, "payload": {"x": 1}, "idempotency_key": f"idem-{key}-1"},
+        f"req-enq-{key}",
+        idem=f"idem-enq-{key}",
+        ts=ts,
+    )["data"]
+    assert data["status"] == "pending"
+    return data["task_id"]
+
+
+def _claim(oracle: _Oracle, task_id: str, key: str) -> dict[str, Any]:
+    return oracle.post(
+        f"/api/v1/oracle/tx-outbox/{task_id}/claim",
+        {"worker_id": f"w-{key}"},
+        f"req-claim-{key}",
+        idem=f"idem-claim-{key}",
+    )["data"]["task"]
+
+
+@pytest.mark.anyio
+async def test_tx_outbox_enqueue_claim_complete_happy_path(_oracle: _Oracle, _async_client: httpx.AsyncClient) -> None:
+    # The three steps run well inside the signature TTL, so they share one request timestamp.
+    ts = str(time.time_ns() // 1_000_000_000)
+    body, headers = _oracle.signed(
+        _ENQUEUE_PATH,
+        {"task_type": "noop", "payload": {"x": 1}, "idempotency_key": "idem-happy-1"},
+        "req-enq-happy",
+        idem="idem-enq-happy",
+        ts=ts,
     )
-    assert resp.status_code == 200
-    task_id = resp.json()["data"]["task_id"]
-    assert resp.json()["data"]["status"] == "pending"
+    enqueued = await _async_client.post(_ENQUEUE_PATH, content=body, headers=headers)
+    assert enqueued.status_code == 200
+    task = json.loads(enqueued.content)["data"]
+    assert task["status"] == "pending"
+    task_id = task["task_id"]
 
+    # Claim and complete only depend on the task id, so both are signed before either is sent.
     claim_path = f"/api/v1/oracle/tx-outbox/{task_id}/claim"
-    claim_body = json.dumps({"worker_id": "w1"}, separators=(",", ":"), sort_keys=True).encode("utf-8")
-    resp = _client.post(
-        claim_path,
-        content=claim_body,
-        headers=_oracle_headers(claim_path, claim_body, "req-claim", idem="idem-claim"),
-    )
-    assert resp.status_code == 200
-    assert resp.json()["success"] is True
-    assert resp.json()["data"]["task"]["status"] == "processing"
-
     complete_path = f"/api/v1/oracle/tx-outbox/{task_id}/complete"
-    complete_body = json.dumps({"status": "succeeded", "error_hint": None}, separators=(",", ":"), sort_keys=True).encode("utf-8")
-    resp = _client.post(
-        complete_path,
-        content=complete_body,
-        headers=_oracle_headers(complete_path, complete_body, "req-comp", idem="idem-comp"),
+    claim_body, claim_headers = _oracle.signed(claim_path, {"worker_id": "w1"}, "req-claim", idem="idem-claim", ts=ts)
+    complete_body, complete_headers = _oracle.signed(
+        complete_path, {"status": "succeeded", "error_hint": None}, "req-comp", idem="idem-comp", ts=ts
     )
-    assert resp.status_code == 200
-    assert resp.json()["data"]["status"] == "succeeded"
-
-
-def test_tx_outbox_claim_next_claims_oldest_pending(_client: TestClient) -> None:
-    enqueue_path = "/api/v1/oracle/tx-outbox"
-    for i in range(2):
-        body = json.dumps(
-            {"task_type": "noop", "payload": {"i": i}, "idempotency_key": f"idem-{i}"},
-            separators=(",", ":"),
-            sort_keys=True,
-        ).encode("utf-8")
-        resp = _client.post(
-            enqueue_path,
-            content=body,
-            headers=_oracle_headers(enqueue_path, body, f"req-enq-{i}", idem=f"idem-enq-{i}"),
+
+    claimed = await _async_client.post(claim_path, content=claim_body, headers=claim_headers)
+    assert claimed.status_code == 200
+    payload = json.loads(claimed.content)
+    assert payload["success"] is True
+    assert payload["data"]["task"]["status"] == "processing"
+
+    completed = await _async_client.post(complete_path, content=complete_body, headers=complete_headers)
+    assert completed.status_code == 200
+    assert json.loads(completed.content)["data"]["status"] == "succeeded"
+
+
+def test_tx_outbox_claim_next_claims_oldest_pending(_oracle: _Oracle, _db: sessionmaker[Session]) -> None:
+    # Only claim-next is under test here; the enqueue endpoint is covered by the other tests.
+    with _db() as db:
+        db.add_all(
+            [
+                TxOutbox(
+                    task_id=f"txo_oldest_{i}",
+                    idempotency_key=f"idem-{i}",
+                    task_type="noop",
+                    payload_json=_canon({"i": i}).decode("utf-8"),
+                    status="pending",
+                    attempts=0,
+                )
+                for i in range(2)
+            ]
         )
-        assert resp.status_code == 200
+        db.commit()
 
-    claim_next_path = "/api/v1/oracle/tx-outbox/claim-next"
-    claim_body = json.dumps({"worker_id": "w-next"}, separators=(",", ":"), sort_keys=True).encode("utf-8")
-    resp = _client.post(
-        claim_next_path,
-        content=claim_body,
-        headers=_oracle_headers(claim_next_path, claim_body, "req-claim-next", idem="idem-claim-next"),
-    )
-    assert resp.status_code == 200
-    assert resp.json()["success"] is True
-    task = resp.json()["data"]["task"]
+    payload = _oracle.post(_CLAIM_NEXT_PATH, {"worker_id": "w-next"}, "req-claim-next", idem="idem-claim-next")
+    assert payload["success"] is True
+    task = payload["data"]["task"]
     assert task["status"] == "processing"
     assert task["locked_by"] == "w-next"
     assert task["payload"]["i"] == 0
 
 
-def test_tx_outbox_pending_requires_hmac_and_lists_items(_client: TestClient) -> None:
-    enqueue_path = "/api/v1/oracle/tx-outbox"
-    body = json.dumps(
-        {"task_type": "noop", "payload": {"x": 1}, "idempotency_key": "idem-pending-1"},
-        separators=(",", ":"),
-        sort_keys=True,
-    ).encode("utf-8")
-    resp = _client.post(
-        enqueue_path,
-        content=body,
-        headers=_oracle_headers(enqueue_path, body, "req-enq-p", idem="idem-enq-p"),
-    )
-    assert resp.status_code == 200
+def test_tx_outbox_pending_requires_hmac_and_lists_items(_oracle: _Oracle) -> None:
+    _enqueue(_oracle, "pending")
 
-    pending_path = "/api/v1/oracle/tx-outbox/pending?limit=10"
-    pending_sign_path = "/api/v1/oracle/tx-outbox/pending"
     # Signed GET with empty body.
-    resp = _client.get(
-        pending_path,
-        headers=_oracle_headers(pending_sign_path, b"", "req-pending", idem="idem-pending", method="GET"),
-    )
-    assert resp.status_code == 200
-    assert resp.json()["success"] is True
-    assert len(resp.json()["data"]["items"]) >= 1
-
-
-def test_tx_outbox_update_persists_tx_hash_and_result(_client: TestClient, _db: sessionmaker[Session]) -> None:
-    enqueue_path = "/api/v1/oracle/tx-outbox"
-    enqueue_body = json.dumps(
-        {"task_type": "noop", "payload": {"x": 1}, "idempotency_key": "idem-upd-1"},
-        separators=(",", ":"),
-        sort_keys=True,
-    ).encode("utf-8")
-    resp = _client.post(
-        enqueue_path,
-        content=enqueue_body,
-        headers=_oracle_headers(enqueue_path, enqueue_body, "req-enq-upd", idem="idem-enq-upd"),
-    )
-    assert resp.status_code == 200
-    task_id = resp.json()["data"]["task_id"]
+    payload = _oracle.get("/api/v1/oracle/tx-outbox/pending", "req-pending", idem="idem-pending", query="limit=10")
+    assert payload["success"] is True
+    assert len(payload["data"]["items"]) >= 1
 
+
+def test_tx_outbox_update_persists_tx_hash_and_result(_oracle: _Oracle, _db: sessionmaker[Session]) -> None:
+    task_id = _enqueue(_oracle, "upd")
     # Claim so task is in processing (update is allowed for pending too, but this matches worker behavior).
-    claim_path = f"/api/v1/oracle/tx-outbox/{task_id}/claim"
-    claim_body = json.dumps({"worker_id": "w-upd"}, separators=(",", ":"), sort_keys=True).encode("utf-8")
-    resp = _client.post(
-        claim_path,
-        content=claim_body,
-        headers=_oracle_headers(claim_path, claim_body, "req-claim-upd", idem="idem-claim-upd"),
-    )
-    assert resp.status_code == 200
+    _claim(_oracle, task_id, "upd")
 
-    update_path = f"/api/v1/oracle/tx-outbox/{task_id}/update"
-    update_body = json.dumps(
+    data = _oracle.post(
+        f"/api/v1/oracle/tx-outbox/{task_id}/update",
         {"tx_hash": "0x" + "c" * 64, "result": {"stage": "submitted"}},
-        separators=(",", ":"),
-        sort_keys=True,
-    ).encode("utf-8")
-    resp = _client.post(
-        update_path,
-        content=update_body,
-        headers=_oracle_headers(update_path, update_body, "req-upd", idem="idem-upd"),
-    )
-    assert resp.status_code == 200
-    assert resp.json()["data"]["tx_hash"] == "0x" + "c" * 64
-    assert resp.json()["data"]["result"]["stage"] == "submitted"
+        "req-upd",
+        idem="idem-upd",
+    )["data"]
+    assert data["tx_hash"] == "0x" + "c" * 64
+    assert data["result"]["stage"] == "submitted"
 
     with _db() as db:
         row = db.query(TxOutbox).filter(TxOutbox.task_id == task_id).first()
@@ -230,92 +210,50 @@ def test_tx_outbox_update_persists_tx_hash_and_result(_client: TestClient, _db:
         assert row.result_json is not None
 
 
-def test_tx_outbox_claim_next_reclaims_stale_processing_task(_client: TestClient, _db: sessionmaker[Session], monkeypatch: pytest.MonkeyPatch) -> None:
+def test_tx_outbox_claim_next_reclaims_stale_processing_task(
+    _oracle: _Oracle, _db: sessionmaker[Session], monkeypatch: pytest.MonkeyPatch
+) -> None:
     # Make lock TTL tiny so we can deterministically reclaim.
     monkeypatch.setenv("TX_OUTBOX_LOCK_TTL_SECONDS", "1")
 
-    enqueue_path = "/api/v1/oracle/tx-outbox"
-    enqueue_body = json.dumps(
-        {"task_type": "noop", "payload": {"x": 1}, "idempotency_key": "idem-stale-1"},
-        separators=(",", ":"),
-        sort_keys=True,
-    ).encode("utf-8")
-    resp = _client.post(
-        enqueue_path,
-        content=enqueue_body,
-        headers=_oracle_headers(enqueue_path, enqueue_body, "req-enq-stale", idem="idem-enq-stale"),
-    )
-    assert resp.status_code == 200
-    task_id = resp.json()["data"]["task_id"]
+    task_id = _enqueue(_oracle, "stale")
 
     # Manually mark task as stale processing in DB.
     with _db() as db:
         row = db.query(TxOutbox).filter(TxOutbox.task_id == task_id).first()
         assert row is not None
         row.status = "processing"
-        row.locked_at = datetime.now(timezone.utc) - timedelta(seconds=10)
+        row.locked_at = _STALE_LOCKED_AT
         row.locked_by = "w-old"
         db.commit()
 
-    claim_next_path = "/api/v1/oracle/tx-outbox/claim-next"
-    claim_body = json.dumps({"worker_id": "w-new"}, separators=(",", ":"), sort_keys=True).encode("utf-8")
-    resp = _client.post(
-        claim_next_path,
-        content=claim_body,
-        headers=_oracle_headers(claim_next_path, claim_body, "req-claim-stale", idem="idem-claim-stale"),
-    )
-    assert resp.status_code == 200
-    assert resp.json()["success"] is True
-    assert resp.json()["data"]["task"]["task_id"] == task_id
-    assert resp.json()["data"]["task"]["locked_by"] == "w-new"
-
-
-def test_tx_outbox_complete_pending_requeues_and_clears_tx_state(_client: TestClient, _db: sessionmaker[Session]) -> None:
-    enqueue_path = "/api/v1/oracle/tx-outbox"
-    enqueue_body = json.dumps(
-        {"task_type": "noop", "payload": {"x": 1}, "idempotency_key": "idem-requeue-1"},
-        separators=(",", ":"),
-        sort_keys=True,
-    ).encode("utf-8")
-    resp = _client.post(
-        enqueue_path,
-        content=enqueue_body,
-        headers=_oracle_headers(enqueue_path, enqueue_body, "req-enq-requeue", idem="idem-enq-requeue"),
-    )
-    assert resp.status_code == 200
-    task_id = resp.json()["data"]["task_id"]
+    payload = _oracle.post(_CLAIM_NEXT_PATH, {"worker_id": "w-new"}, "req-claim-stale", idem="idem-claim-stale")
+    assert payload["success"] is True
+    assert payload["data"]["task"]["task_id"] == task_id
+    assert payload["data"]["task"]["locked_by"] == "w-new"
 
-    claim_path = f"/api/v1/oracle/tx-outbox/{task_id}/claim"
-    claim_body = json.dumps({"worker_id": "w-requeue"}, separators=(",", ":"), sort_keys=True).encode("utf-8")
-    resp = _client.post(
-        claim_path,
-        content=claim_body,
-        headers=_oracle_headers(claim_path, claim_body, "req-claim-requeue", idem="idem-claim-requeue"),
-    )
-    assert resp.status_code == 200
-    assert resp.json()["data"]["task"]["status"] == "processing"
 
-    complete_path = f"/api/v1/oracle/tx-outbox/{task_id}/complete"
-    complete_body = json.dumps(
+def test_tx_outbox_complete_pending_requeues_and_clears_tx_state(
+    _oracle: _Oracle, _db: sessionmaker[Session]
+) -> None:
+    task_id = _enqueue(_oracle, "requeue")
+    assert _claim(_oracle, task_id, "requeue")["status"] == "processing"
+
+    data = _oracle.post(
+        f"/api/v1/oracle/tx-outbox/{task_id}/complete",
         {
             "status": "pending",
             "error_hint": "rpc_error",
             "tx_hash": "0x" + "a" * 64,
             "result": {"stage": "retry_pending"},
         },
-        separators=(",", ":"),
-        sort_keys=True,
-    ).encode("utf-8")
-    resp = _client.post(
-        complete_path,
-        content=complete_body,
-        headers=_oracle_headers(complete_path, complete_body, "req-comp-requeue", idem="idem-comp-requeue"),
-    )
-    assert resp.status_code == 200
-    assert resp.json()["data"]["status"] == "pending"
-    assert resp.json()["data"]["tx_hash"] is None
-    assert resp.json()["data"]["locked_by"] is None
-    assert resp.json()["data"]["last_error_hint"] == "rpc_error"
+        "req-comp-requeue",
+        idem="idem-comp-requeue",
+    )["data"]
+    assert data["status"] == "pending"
+    assert data["tx_hash"] is None
+    assert data["locked_by"] is None
+    assert data["last_error_hint"] == "rpc_error"
 
     with _db() as db:
         row = db.query(TxOutbox).filter(TxOutbox.task_id == task_id).first()
@@ -326,48 +264,22 @@ def test_tx_outbox_complete_pending_requeues_and_clears_tx_state(_client: TestCl
         assert row.locked_by is None
 
 
-def test_tx_outbox_complete_blocked_finalizes_task(_client: TestClient, _db: sessionmaker[Session]) -> None:
-    enqueue_path = "/api/v1/oracle/tx-outbox"
-    enqueue_body = json.dumps(
-        {"task_type": "create_distribution", "payload": {"x": 1}, "idempotency_key": "idem-blocked-1"},
-        separators=(",", ":"),
-        sort_keys=True,
-    ).encode("utf-8")
-    resp = _client.post(
-        enqueue_path,
-        content=enqueue_body,
-        headers=_oracle_headers(enqueue_path, enqueue_body, "req-enq-blocked", idem="idem-enq-blocked"),
-    )
-    assert resp.status_code == 200
-    task_id = resp.json()["data"]["task_id"]
-
-    claim_path = f"/api/v1/oracle/tx-outbox/{task_id}/claim"
-    claim_body = json.dumps({"worker_id": "w-blocked"}, separators=(",", ":"), sort_keys=True).encode("utf-8")
-    resp = _client.post(
-        claim_path,
-        content=claim_body,
-        headers=_oracle_headers(claim_path, claim_body, "req-claim-blocked", idem="idem-claim-blocked"),
-    )
-    assert resp.status_code == 200
+def test_tx_outbox_complete_blocked_finalizes_task(_oracle: _Oracle, _db: sessionmaker[Session]) -> None:
+    task_id = _enqueue(_oracle, "blocked", task_type="create_distribution")
+    _claim(_oracle, task_id, "blocked")
 
-    complete_path = f"/api/v1/oracle/tx-outbox/{task_id}/complete"
-    complete_body = json.dumps(
+    data = _oracle.post(
+        f"/api/v1/oracle/tx-outbox/{task_id}/complete",
         {
             "status": "blocked",
             "error_hint": "safe_execution_required",
             "result": {"stage": "safe_execution_required"},
         },
-        separators=(",", ":"),
-        sort_keys=True,
-    ).encode("utf-8")
-    resp = _client.post(
-        complete_path,
-        content=complete_body,
-        headers=_oracle_headers(complete_path, complete_body, "req-comp-blocked", idem="idem-comp-blocked"),
-    )
-    assert resp.status_code == 200
-    assert resp.json()["data"]["status"] == "blocked"
-    assert resp.json()["data"]["last_error_hint"] == "safe_execution_required"
+        "req-comp-blocked",
+        idem="idem-comp-blocked",
+    )["data"]
+    assert data["status"] == "blocked"
+    assert data["last_error_hint"] == "safe_execution_required"
 
     with _db() as db:
         row = db.query(TxOutbox).filter(TxOutbox.task_id == task_id).first()
@@ -7,35 +7,41 @@ import argparse
 import json
 import sys
 from pathlib import Path
-
-from sqlalchemy.orm import Session
-
+from typing import TYPE_CHECKING, Any
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 BACKEND_DIR = REPO_ROOT / "backend"
 if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
-from src.core.config import get_settings  # noqa: E402
-from src.core.database import SessionLocal  # noqa: E402
-from src.models.bounty import Bounty  # noqa: E402
-from src.services.bounty_git import (  # noqa: E402
-    apply_bounty_git_metadata_backfill,
-    bounty_needs_git_metadata_backfill,
-    extract_git_pr_url,
-    find_backfill_git_outbox_candidate,
-)
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from src.models.bounty import Bounty
+
+
+def _emit(payload: dict[str, Any]) -> None:
+    sys.stdout.write(json.dumps(payload, ensure_ascii=True) + "\n")
 
 
 def _find_bounty(db: Session, identifier: str) -> Bounty | None:
+    from sqlalchemy import case, or_
+
+    from src.models.bounty import Bounty
+
     candidate = str(identifier or "").strip()
     if not candidate:
         return None
-    if candidate.isdigit():
-        row = db.query(Bounty).filter(Bounty.id == int(candidate)).first()
-        if row is not None:
-            return row
-    return db.query(Bounty).filter(Bounty.bounty_id == candidate).first()
+    if not candidate.isdigit():
+        return db.query(Bounty).filter(Bounty.bounty_id == candidate).first()
+    # A numeric identifier may be the internal id or a public bounty_id; prefer the id match, in one query.
+    bounty_pk = int(candidate)
+    return (
+        db.query(Bounty)
+        .filter(or_(Bounty.id == bounty_pk, Bounty.bounty_id == candidate))
+        .order_by(case((Bounty.id == bounty_pk, 0), else_=1))
+        .first()
+    )
 
 
 def main() -> int:
@@ -47,35 +53,37 @@ def main() -> int:
     parser.add_argument("--dry-run", action="store_true")
     args = parser.parse_args()
 
+    # Backend imports pull in SQLAlchemy and every model; keep them off the --help / bad-args path.
+    from src.core.config import get_settings
+    from src.core.database import SessionLocal
+    from src.services.bounty_git import (
+        apply_bounty_git_metadata_backfill,
+        bounty_needs_git_metadata_backfill,
+        extract_git_pr_url,
+        find_backfill_git_outbox_candidate,
+    )
+
     settings = get_settings()
     if SessionLocal is None or not settings.database_url:
-        print(json.dumps({"ok": False, "error": "database_not_configured"}, ensure_ascii=True))
+        _emit({"ok": False, "error": "database_not_configured"})
         return 2
 
     with SessionLocal() as db:
         bounty = _find_bounty(db, args.bounty_id)
         if bounty is None:
-            print(
-                json.dumps(
-                    {"ok": False, "error": "bounty_not_found", "bounty_id": args.bounty_id},
-                    ensure_ascii=True,
-                )
-            )
+            _emit({"ok": False, "error": "bounty_not_found", "bounty_id": args.bounty_id})
             return 1
 
         if not args.force and not bounty_needs_git_metadata_backfill(bounty):
-            print(
-                json.dumps(
-                    {
-                        "ok": True,
-                        "status": "skipped",
-                        "reason": "already_has_real_git_metadata",
-                        "bounty_id": bounty.bounty_id,
-                        "pr_url": bounty.pr_url,
-                        "merge_sha": bounty.merge_sha,
-                    },
-                    ensure_ascii=True,
-                )
+            _emit(
+                {
+                    "ok": True,
+                    "status": "skipped",
+                    "reason": "already_has_real_git_metadata",
+                    "bounty_id": bounty.bounty_id,
+                    "pr_url": bounty.pr_url,
+                    "merge_sha": bounty.merge_sha,
+                }
             )
             return 0
 
@@ -86,17 +94,14 @@ def main() -> int:
             task_type=args.task_type,
         )
         if candidate is None:
-            print(
-                json.dumps(
-                    {
-                        "ok": False,
-                        "error": "git_task_not_found",
-                        "bounty_id": bounty.bounty_id,
-                        "task_id": args.task_id,
-                        "task_type": args.task_type,
-                    },
-                    ensure_ascii=True,
-                )
+            _emit(
+                {
+                    "ok": False,
+                    "error": "git_task_not_found",
+                    "bounty_id": bounty.bounty_id,
+                    "task_id": args.task_id,
+                    "task_type": args.task_type,
+                }
             )
             return 1
 
@@ -106,26 +111,23 @@ def main() -> int:
 
         if changed and not args.dry_run:
             db.commit()
-        else:
+        elif changed:
             db.rollback()
 
-        print(
-            json.dumps(
-                {
-                    "ok": True,
-                    "status": "updated" if changed and not args.dry_run else ("dry_run" if changed else "no_change"),
-                    "bounty_id": bounty.bounty_id,
-                    "task": {
-                        "task_id": candidate.task_id,
-                        "task_type": candidate.task_type,
-                        "commit_sha": candidate.commit_sha,
-                        "pr_url": extract_git_pr_url(candidate),
-                    },
-                    "before": before,
-                    "after": after,
+        _emit(
+            {
+                "ok": True,
+                "status": "updated" if changed and not args.dry_run else ("dry_run" if changed else "no_change"),
+                "bounty_id": bounty.bounty_id,
+                "task": {
+                    "task_id": candidate.task_id,
+                    "task_type": candidate.task_type,
+                    "commit_sha": candidate.commit_sha,
+                    "pr_url": extract_git_pr_url(candidate),
                 },
-                ensure_ascii=True,
-            )
+                "before": before,
+                "after": after,
+            }
         )
     return 0
 